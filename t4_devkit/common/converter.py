@@ -1,14 +1,26 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import sys
+from typing import TYPE_CHECKING, Callable, TypeVar
 
 import numpy as np
 from pyquaternion import Quaternion
 
 if TYPE_CHECKING:
-    from t4_devkit.typing import ArrayLike, NDArray
+    from enum import Enum
 
-__all__ = ["to_quaternion"]
+    from t4_devkit.typing import ArrayLike, NDArray, NDArrayF64
+
+__all__ = [
+    "to_quaternion",
+    "to_float64_array",
+    "to_optional_float64_array",
+    "to_enum",
+    "to_optional_enum",
+    "to_interned_list",
+]
+
+_EnumT = TypeVar("_EnumT", bound="Enum")
 
 
 def to_quaternion(value: ArrayLike | NDArray) -> Quaternion:
@@ -25,3 +37,83 @@ def to_quaternion(value: ArrayLike | NDArray) -> Quaternion:
         if isinstance(value, np.ndarray) and value.ndim == 2
         else Quaternion(value)
     )
+
+
+def to_float64_array(value: ArrayLike | NDArray) -> NDArrayF64:
+    """Convert input array like to `NDArrayF64`.
+
+    If the input is already a float64 array, it is returned without copy.
+
+    Args:
+        value (ArrayLike | NDArray): Array like value.
+
+    Returns:
+        NDArrayF64: Converted array.
+    """
+    return np.asarray(value, dtype=np.float64)
+
+
+def to_optional_float64_array(value: ArrayLike | NDArray | None) -> NDArrayF64 | None:
+    """Convert input array like to `NDArrayF64` unless it is `None`.
+
+    Args:
+        value (ArrayLike | NDArray | None): Array like value or `None`.
+
+    Returns:
+        NDArrayF64 | None: Converted array, or `None` if the input is `None`.
+    """
+    return None if value is None else np.asarray(value, dtype=np.float64)
+
+
+def to_enum(enum_cls: type[_EnumT]) -> Callable[[object], _EnumT]:
+    """Return a converter which converts input value into a member of the specified enum.
+
+    Members are looked up from the value map directly, and input members are returned as they are.
+
+    Args:
+        enum_cls (type[_EnumT]): Enum class to be converted into.
+
+    Returns:
+        Callable[[object], _EnumT]: Converter function.
+    """
+
+    def _converter(value: object) -> _EnumT:
+        if type(value) is enum_cls:
+            return value
+
+        try:
+            return enum_cls._value2member_map_[value]
+        except (KeyError, TypeError):
+            raise ValueError(f"{value!r} is not a valid {enum_cls.__name__}") from None
+
+    return _converter
+
+
+def to_optional_enum(enum_cls: type[_EnumT]) -> Callable[[object], _EnumT | None]:
+    """Return a converter which converts input value into a member of the specified enum
+    unless it is `None`.
+
+    Args:
+        enum_cls (type[_EnumT]): Enum class to be converted into.
+
+    Returns:
+        Callable[[object], _EnumT | None]: Converter function.
+    """
+    converter = to_enum(enum_cls)
+
+    def _converter(value: object) -> _EnumT | None:
+        return None if value is None else converter(value)
+
+    return _converter
+
+
+def to_interned_list(value: list[str]) -> list[str]:
+    """Convert input strings into a list of interned strings.
+
+    Args:
+        value (list[str]): List of strings.
+
+    Returns:
+        list[str]: List of interned strings.
+    """
+    return [sys.intern(v) for v in value]
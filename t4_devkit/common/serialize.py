@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable
 
 import numpy as np
-from attrs import asdict, fields, filters
+from attrs import fields, has
 from pyquaternion import Quaternion
 
 
@@ -19,17 +20,61 @@ def serialize_dataclass(data: Any) -> dict[str, Any]:
     Returns:
         dict[str, Any]: Serialized dict.
     """
-    excludes = filters.exclude(*[a for a in fields(data.__class__) if not a.init])
-    return asdict(data, filter=excludes, value_serializer=_value_serializer)
-
-
-def _value_serializer(data: Any, attribute: Any, value: Any) -> Any:
-    if isinstance(value, np.ndarray):
-        return value.tolist()
-    elif isinstance(value, Quaternion):
-        return value.q.tolist()
-    elif isinstance(value, tuple):
-        return list(value)
-    elif isinstance(value, Enum):
-        return value.value
-    return value
+    return {name: _value_serializer(getattr(data, name)) for name in _init_fields(data.__class__)}
+
+
+@lru_cache(maxsize=None)
+def _init_fields(cls: type) -> tuple[str, ...]:
+    """Return names of fields to be serialized, which are computed only once per class.
+
+    Args:
+        cls (type): Dataclass type.
+
+    Returns:
+        Names of fields specified with `init=True`.
+    """
+    return tuple(a.name for a in fields(cls) if a.init)
+
+
+def _value_serializer(value: Any) -> Any:
+    serializer = _find_serializer(value.__class__)
+    return value if serializer is None else serializer(value)
+
+
+@lru_cache(maxsize=None)
+def _find_serializer(cls: type) -> Callable[[Any], Any] | None:
+    """Return the serializer for the input type, which is looked up only once per type.
+
+    Args:
+        cls (type): Type of value.
+
+    Returns:
+        Serializer function, or None if the value can be returned as it is.
+    """
+    if has(cls):
+        return serialize_dataclass
+
+    for base in cls.__mro__:
+        if base in _SERIALIZERS:
+            return _SERIALIZERS[base]
+    return None
+
+
+def _serialize_sequence(value: list | tuple | set | frozenset) -> list[Any]:
+    return [_value_serializer(v) for v in value]
+
+
+def _serialize_mapping(value: dict) -> dict[Any, Any]:
+    return {_value_serializer(k): _value_serializer(v) for k, v in value.items()}
+
+
+_SERIALIZERS: dict[type, Callable[[Any], Any]] = {
+    np.ndarray: np.ndarray.tolist,
+    Quaternion: lambda value: value.q.tolist(),
+    Enum: lambda value: value.value,
+    list: _serialize_sequence,
+    tuple: _serialize_sequence,
+    set: _serialize_sequence,
+    frozenset: _serialize_sequence,
+    dict: _serialize_mapping,
+}
@@ -62,9 +62,14 @@ class SchemaName(str, Enum):
         Returns:
             Return True if this schema is optional.
         """
-        return self in (
-            SchemaName.OBJECT_ANN,
-            SchemaName.SURFACE_ANN,
-            SchemaName.KEYPOINT,
-            SchemaName.VEHICLE_STATE,
-        )
+        return self in _OPTIONAL_SCHEMAS
+
+
+_OPTIONAL_SCHEMAS = frozenset(
+    (
+        SchemaName.OBJECT_ANN,
+        SchemaName.SURFACE_ANN,
+        SchemaName.KEYPOINT,
+        SchemaName.VEHICLE_STATE,
+    )
+)
@@ -9,8 +9,8 @@ from .registry import SCHEMAS
 __all__ = ["Attribute"]
 
 
-@define(slots=False)
 @SCHEMAS.register(SchemaName.ATTRIBUTE)
+@define
 class Attribute(SchemaBase):
     """A dataclass to represent schema table of `attribute.json`.
 
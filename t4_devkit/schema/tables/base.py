@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from abc import ABC
 from secrets import token_hex
 from typing import Any, TypeVar
@@ -53,12 +54,25 @@ class SchemaBase(ABC):
         Returns:
             Schema instance with a new token.
         """
-        new_data = data.copy()
-
         token = token_hex(nbytes=token_nbytes)
-        new_data["token"] = token
+        return cls.from_dict({**data, "token": token})
+
+    @classmethod
+    def new_many(cls, data: list[dict[str, Any]], *, token_nbytes: int = 16) -> list[SchemaTable]:
+        """Create new schema instances generating random tokens at once.
 
-        return cls.from_dict(new_data)
+        Args:
+            data (list[dict[str, Any]]): List of schema field data without token.
+            token_nbytes (int, optional): The number of bytes of each new token.
+
+        Returns:
+            List of schema instances with new tokens.
+        """
+        buffer = os.urandom(token_nbytes * len(data))
+        return [
+            cls.from_dict({**d, "token": buffer[i * token_nbytes : (i + 1) * token_nbytes].hex()})
+            for i, d in enumerate(data)
+        ]
 
 
 SchemaTable = TypeVar("SchemaTable", bound=SchemaBase)
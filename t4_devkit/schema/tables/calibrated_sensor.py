@@ -2,10 +2,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-import numpy as np
 from attrs import define, field
 
-from t4_devkit.common.converter import to_quaternion
+from t4_devkit.common.converter import to_float64_array, to_quaternion
 
 from ..name import SchemaName
 from .base import SchemaBase
@@ -17,8 +16,8 @@ if TYPE_CHECKING:
 __all__ = ["CalibratedSensor"]
 
 
-@define(slots=False)
 @SCHEMAS.register(SchemaName.CALIBRATED_SENSOR)
+@define
 class CalibratedSensor(SchemaBase):
     """A dataclass to represent schema table of `calibrated_sensor.json`.
 
@@ -32,7 +31,7 @@ class CalibratedSensor(SchemaBase):
     """
 
     sensor_token: str
-    translation: TranslationType = field(converter=np.array)
+    translation: TranslationType = field(converter=to_float64_array)
     rotation: RotationType = field(converter=to_quaternion)
-    camera_intrinsic: CamIntrinsicType = field(converter=np.array)
-    camera_distortion: CamDistortionType = field(converter=np.array)
+    camera_intrinsic: CamIntrinsicType = field(converter=to_float64_array)
+    camera_distortion: CamDistortionType = field(converter=to_float64_array)
@@ -9,8 +9,8 @@ from .registry import SCHEMAS
 __all__ = ("Category",)
 
 
-@define(slots=False)
 @SCHEMAS.register(SchemaName.CATEGORY)
+@define
 class Category(SchemaBase):
     """A dataclass to represent schema table of `category.json`.
 
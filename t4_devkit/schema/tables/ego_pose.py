@@ -2,11 +2,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-import numpy as np
 from attrs import define, field
-from attrs.converters import optional
 
-from t4_devkit.common.converter import to_quaternion
+from t4_devkit.common.converter import to_float64_array, to_optional_float64_array, to_quaternion
 
 from ..name import SchemaName
 from .base import SchemaBase
@@ -24,8 +22,8 @@ if TYPE_CHECKING:
 __all__ = ["EgoPose"]
 
 
-@define(slots=False)
 @SCHEMAS.register(SchemaName.EGO_POSE)
+@define
 class EgoPose(SchemaBase):
     """A dataclass to represent schema table of `ego_pose.json`.
 
@@ -43,9 +41,11 @@ class EgoPose(SchemaBase):
             (latitude, longitude, altitude) in degrees and meters.
     """
 
-    translation: TranslationType = field(converter=np.array)
+    translation: TranslationType = field(converter=to_float64_array)
     rotation: RotationType = field(converter=to_quaternion)
     timestamp: int
-    twist: TwistType | None = field(default=None, converter=optional(np.array))
-    acceleration: AccelerationType | None = field(default=None, converter=optional(np.array))
-    geocoordinate: GeoCoordinateType | None = field(default=None, converter=optional(np.array))
+    twist: TwistType | None = field(default=None, converter=to_optional_float64_array)
+    acceleration: AccelerationType | None = field(default=None, converter=to_optional_float64_array)
+    geocoordinate: GeoCoordinateType | None = field(
+        default=None, converter=to_optional_float64_array
+    )
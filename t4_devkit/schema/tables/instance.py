@@ -1,4 +1,8 @@
-from attrs import define
+from __future__ import annotations
+
+import sys
+
+from attrs import define, field
 
 from ..name import SchemaName
 from .base import SchemaBase
@@ -7,8 +11,8 @@ from .registry import SCHEMAS
 __all__ = ["Instance"]
 
 
-@define(slots=False)
 @SCHEMAS.register(SchemaName.INSTANCE)
+@define
 class Instance(SchemaBase):
     """A dataclass to represent schema table of `instance.json`.
 
@@ -21,7 +25,7 @@ class Instance(SchemaBase):
         last_annotation_token (str): Foreign key pointing to the last annotation of this instance.
     """
 
-    category_token: str
+    category_token: str = field(converter=sys.intern)
     instance_name: str
     nbr_annotations: int
     first_annotation_token: str
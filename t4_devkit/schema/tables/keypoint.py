@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING
 
-import numpy as np
 from attrs import define, field
 
+from t4_devkit.common.converter import to_float64_array
+
 from ..name import SchemaName
 from .base import SchemaBase
 from .registry import SCHEMAS
@@ -15,8 +17,8 @@ if TYPE_CHECKING:
 __all__ = ["Keypoint"]
 
 
-@define(slots=False)
 @SCHEMAS.register(SchemaName.KEYPOINT)
+@define
 class Keypoint(SchemaBase):
     """A dataclass to represent schema table of `keypoint.json`.
 
@@ -29,8 +31,8 @@ class Keypoint(SchemaBase):
         num_keypoints (int): The number of keypoints to be annotated.
     """
 
-    sample_data_token: str
-    instance_token: str
+    sample_data_token: str = field(converter=sys.intern)
+    instance_token: str = field(converter=sys.intern)
     category_tokens: list[str]
-    keypoints: KeypointType = field(converter=np.array)
+    keypoints: KeypointType = field(converter=to_float64_array)
     num_keypoints: int
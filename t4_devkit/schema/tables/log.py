@@ -9,8 +9,8 @@ from .registry import SCHEMAS
 __all__ = ["Log"]
 
 
-@define(slots=False)
 @SCHEMAS.register(SchemaName.LOG)
+@define
 class Log(SchemaBase):
     """A dataclass to represent schema table of `log.json`.
 
@@ -33,4 +33,4 @@ class Log(SchemaBase):
     location: str
 
     # shortcuts
-    map_token: str = field(init=False, factory=str)
+    map_token: str = field(init=False, default="")
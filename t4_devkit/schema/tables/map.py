@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from attrs import define
+from attrs import define, field
+
+from t4_devkit.common.converter import to_interned_list
 
 from ..name import SchemaName
 from .base import SchemaBase
@@ -9,8 +11,8 @@ from .registry import SCHEMAS
 __all__ = ["Map"]
 
 
-@define(slots=False)
 @SCHEMAS.register(SchemaName.MAP)
+@define
 class Map(SchemaBase):
     """A dataclass to represent schema table of `map.json`.
 
@@ -21,6 +23,6 @@ class Map(SchemaBase):
         filename (str): Relative path to the file with the map mask.
     """
 
-    log_tokens: list[str]
+    log_tokens: list[str] = field(converter=to_interned_list)
     category: str
     filename: str
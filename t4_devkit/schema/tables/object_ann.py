@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-import base64
+import binascii
+import sys
 from typing import TYPE_CHECKING
 
 from attrs import define, field
 from pycocotools import mask as cocomask
 
+from t4_devkit.common.converter import to_interned_list
+
 from ..name import SchemaName
 from .base import SchemaBase
 from .registry import SCHEMAS
@@ -21,11 +24,11 @@ class RLEMask:
     """A dataclass to represent segmentation mask compressed by RLE.
 
     Attributes:
-        size (list[int, int]): Size of image ordering (width, height).
+        size (tuple[int, int]): Size of image ordering (width, height).
         counts (str): RLE compressed mask data.
     """
 
-    size: list[int, int]
+    size: tuple[int, int] = field(converter=tuple)
     counts: str
 
     @property
@@ -42,13 +45,25 @@ class RLEMask:
         Returns:
             Decoded mask in shape of (H, W).
         """
-        counts = base64.b64decode(self.counts)
+        counts = binascii.a2b_base64(self.counts)
         data = {"counts": counts, "size": self.size}
         return cocomask.decode(data)
 
 
-@define(slots=False)
+def _to_rle_mask(value: dict | RLEMask) -> RLEMask:
+    """Convert a dict into `RLEMask` unless it is already converted.
+
+    Args:
+        value (dict | RLEMask): Mask data.
+
+    Returns:
+        Converted `RLEMask`.
+    """
+    return RLEMask(**value) if isinstance(value, dict) else value
+
+
 @SCHEMAS.register(SchemaName.OBJECT_ANN)
+@define
 class ObjectAnn(SchemaBase):
     """A dataclass to represent schema table of `object_ann.json`.
 
@@ -68,16 +83,16 @@ class ObjectAnn(SchemaBase):
         category_name (str): Category name. This should be set after instantiated.
     """
 
-    sample_data_token: str
-    instance_token: str
-    category_token: str
-    attribute_tokens: list[str]
+    sample_data_token: str = field(converter=sys.intern)
+    instance_token: str = field(converter=sys.intern)
+    category_token: str = field(converter=sys.intern)
+    attribute_tokens: list[str] = field(converter=to_interned_list)
     bbox: RoiType = field(converter=tuple)
-    mask: RLEMask = field(converter=lambda x: RLEMask(**x) if isinstance(x, dict) else x)
+    mask: RLEMask = field(converter=_to_rle_mask)
     automatic_annotation: bool = field(default=False)
 
     # shortcuts
-    category_name: str = field(init=False, factory=str)
+    category_name: str = field(init=False, default="")
 
     @property
     def width(self) -> int:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sys
+
 from attrs import define, field
 
 from ..name import SchemaName
@@ -9,8 +11,8 @@ from .registry import SCHEMAS
 __all__ = ["Sample"]
 
 
-@define(slots=False)
 @SCHEMAS.register(SchemaName.SAMPLE)
+@define
 class Sample(SchemaBase):
     """A dataclass to represent schema table of `sample.json`.
 
@@ -34,7 +36,7 @@ class Sample(SchemaBase):
     """
 
     timestamp: int
-    scene_token: str
+    scene_token: str = field(converter=sys.intern)
     next: str  # noqa: A003
     prev: str
 
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING
 
-import numpy as np
 from attrs import define, field
-from attrs.converters import optional
 
-from t4_devkit.common.converter import to_quaternion
+from t4_devkit.common.converter import (
+    to_float64_array,
+    to_interned_list,
+    to_optional_float64_array,
+    to_quaternion,
+)
 
 from ..name import SchemaName
 from .base import SchemaBase
@@ -24,8 +28,8 @@ if TYPE_CHECKING:
 __all__ = ["SampleAnnotation"]
 
 
-@define(slots=False)
 @SCHEMAS.register(SchemaName.SAMPLE_ANNOTATION)
+@define
 class SampleAnnotation(SchemaBase):
     """A dataclass to represent schema table of `sample_annotation.json`.
 
@@ -56,20 +60,20 @@ class SampleAnnotation(SchemaBase):
         category_name (str): Category name. This should be set after instantiated.
     """
 
-    sample_token: str
-    instance_token: str
-    attribute_tokens: list[str]
-    visibility_token: str
-    translation: TranslationType = field(converter=np.array)
-    size: SizeType = field(converter=np.array)
+    sample_token: str = field(converter=sys.intern)
+    instance_token: str = field(converter=sys.intern)
+    attribute_tokens: list[str] = field(converter=to_interned_list)
+    visibility_token: str = field(converter=sys.intern)
+    translation: TranslationType = field(converter=to_float64_array)
+    size: SizeType = field(converter=to_float64_array)
     rotation: RotationType = field(converter=to_quaternion)
     num_lidar_pts: int
     num_radar_pts: int
     next: str  # noqa: A003
     prev: str
-    velocity: VelocityType | None = field(default=None, converter=optional(np.array))
-    acceleration: AccelerationType | None = field(default=None, converter=optional(np.array))
+    velocity: VelocityType | None = field(default=None, converter=to_optional_float64_array)
+    acceleration: AccelerationType | None = field(default=None, converter=to_optional_float64_array)
     automatic_annotation: bool = field(default=False)
 
     # shortcuts
-    category_name: str = field(init=False, factory=str)
+    category_name: str = field(init=False, default="")
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import sys
 from enum import Enum, unique
 from typing import TYPE_CHECKING
 
 from attrs import define, field
 
+from t4_devkit.common.converter import to_enum
+
 from ..name import SchemaName
 from .base import SchemaBase
 from .registry import SCHEMAS
@@ -43,7 +46,7 @@ class FileFormat(str, Enum):
         Returns:
             Return True if the item is included.
         """
-        return item in FileFormat.values()
+        return item in _FILEFORMAT_VALUES
 
     @staticmethod
     def values() -> list[str]:
@@ -52,7 +55,7 @@ class FileFormat(str, Enum):
         Returns:
             List of values.
         """
-        return [v.value for v in FileFormat]
+        return list(_FILEFORMAT_VALUES)
 
     def as_ext(self) -> str:
         """Return the value as file extension.
@@ -63,8 +66,11 @@ class FileFormat(str, Enum):
         return f".{self.value}"
 
 
-@define(slots=False)
+_FILEFORMAT_VALUES: tuple[str, ...] = tuple(v.value for v in FileFormat)
+
+
 @SCHEMAS.register(SchemaName.SAMPLE_DATA)
+@define
 class SampleData(SchemaBase):
     """A class to represent schema table of `sample_data.json`.
 
@@ -91,11 +97,11 @@ class SampleData(SchemaBase):
         channel (str): Sensor channel. This should be set after instantiated.
     """
 
-    sample_token: str
+    sample_token: str = field(converter=sys.intern)
     ego_pose_token: str
-    calibrated_sensor_token: str
+    calibrated_sensor_token: str = field(converter=sys.intern)
     filename: str
-    fileformat: FileFormat = field(converter=FileFormat)
+    fileformat: FileFormat = field(converter=to_enum(FileFormat))
     width: int
     height: int
     timestamp: int
@@ -106,4 +112,4 @@ class SampleData(SchemaBase):
 
     # shortcuts
     modality: SensorModality | None = field(init=False, default=None)
-    channel: str = field(init=False, factory=str)
+    channel: str = field(init=False, default="")
@@ -9,8 +9,8 @@ from .registry import SCHEMAS
 __all__ = ["Scene"]
 
 
-@define(slots=False)
 @SCHEMAS.register(SchemaName.SCENE)
+@define
 class Scene(SchemaBase):
     """A dataclass to represent schema table of `scene.json`.
 
@@ -4,6 +4,8 @@ from enum import Enum, unique
 
 from attrs import define, field
 
+from t4_devkit.common.converter import to_enum
+
 from ..name import SchemaName
 from .base import SchemaBase
 from .registry import SCHEMAS
@@ -26,8 +28,8 @@ class SensorModality(str, Enum):
     RADAR = "radar"
 
 
-@define(slots=False)
 @SCHEMAS.register(SchemaName.SENSOR)
+@define
 class Sensor(SchemaBase):
     """A dataclass to represent schema table of `sensor.json`.
 
@@ -42,7 +44,7 @@ class Sensor(SchemaBase):
     """
 
     channel: str
-    modality: SensorModality = field(converter=SensorModality)
+    modality: SensorModality = field(converter=to_enum(SensorModality))
 
     # shortcuts
-    first_sd_token: str = field(init=False, factory=str)
+    first_sd_token: str = field(init=False, default="")
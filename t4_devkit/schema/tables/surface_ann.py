@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import binascii
+import sys
 from typing import TYPE_CHECKING
 
-import numpy as np
 from attrs import define, field
+from pycocotools import mask as cocomask
 
 from ..name import SchemaName
 from .base import SchemaBase
-from .object_ann import RLEMask
+from .object_ann import RLEMask, _to_rle_mask
 from .registry import SCHEMAS
 
 if TYPE_CHECKING:
@@ -16,8 +18,8 @@ if TYPE_CHECKING:
 __all__ = ["SurfaceAnn"]
 
 
-@define(slots=False)
 @SCHEMAS.register(SchemaName.SURFACE_ANN)
+@define
 class SurfaceAnn(SchemaBase):
     """A dataclass to represent schema table of `surface_ann.json`.
 
@@ -34,23 +36,31 @@ class SurfaceAnn(SchemaBase):
         category_name (str): Category name. This should be set after instantiated.
     """
 
-    sample_data_token: str
-    category_token: str
-    mask: RLEMask = field(converter=lambda x: RLEMask(**x) if isinstance(x, dict) else x)
+    sample_data_token: str = field(converter=sys.intern)
+    category_token: str = field(converter=sys.intern)
+    mask: RLEMask = field(converter=_to_rle_mask)
     automatic_annotation: bool = field(default=False)
 
     # shortcuts
-    category_name: str = field(init=False, factory=str)
+    category_name: str = field(init=False, default="")
 
     @property
     def bbox(self) -> RoiType:
-        """Return a bounding box corners calculated from polygon vertices.
+        """Return a bounding box corners calculated from RLE runs without decoding the mask.
+
+        Note that corners are given along the axes of the decoded mask, i.e. x is the row index
+        and y is the column index of `RLEMask.decode()`.
 
         Returns:
             Given as [xmin, ymin, xmax, ymax].
+
+        Raises:
+            ValueError: If the mask is empty.
         """
-        mask = self.mask.decode()
-        indices = np.where(mask == 1)
-        xmin, ymin = np.min(indices, axis=1)
-        xmax, ymax = np.max(indices, axis=1)
-        return xmin, ymin, xmax, ymax
+        counts = binascii.a2b_base64(self.mask.counts)
+        data = {"counts": counts, "size": self.mask.size}
+        # NOTE: `toBbox` returns [col, row, num_cols, num_rows] of the decoded mask
+        col, row, num_cols, num_rows = (int(v) for v in cocomask.toBbox(data))
+        if num_rows == 0 or num_cols == 0:
+            raise ValueError(f"Cannot compute bounding box of empty mask: {self.token}")
+        return row, col, row + num_rows - 1, col + num_cols - 1
@@ -3,7 +3,8 @@ from __future__ import annotations
 from enum import Enum, unique
 
 from attrs import define, field
-from attrs.converters import optional
+
+from t4_devkit.common.converter import to_enum, to_optional_enum
 
 from ..name import SchemaName
 from .base import SchemaBase
@@ -43,9 +44,9 @@ class Indicators:
         hazard (IndicatorState): State of the hazard lights.
     """
 
-    left: IndicatorState = field(converter=IndicatorState)
-    right: IndicatorState = field(converter=IndicatorState)
-    hazard: IndicatorState = field(converter=IndicatorState)
+    left: IndicatorState = field(converter=to_enum(IndicatorState))
+    right: IndicatorState = field(converter=to_enum(IndicatorState))
+    hazard: IndicatorState = field(converter=to_enum(IndicatorState))
 
 
 @define
@@ -59,8 +60,32 @@ class AdditionalInfo:
     speed: float | None = field(default=None)
 
 
-@define(slots=False)
+def _to_indicators(value: dict | Indicators | None) -> Indicators | None:
+    """Convert a dict into `Indicators` unless it is already converted or `None`.
+
+    Args:
+        value (dict | Indicators | None): State of each indicator.
+
+    Returns:
+        Converted `Indicators`, or `None` if the input is `None`.
+    """
+    return Indicators(**value) if isinstance(value, dict) else value
+
+
+def _to_additional_info(value: dict | AdditionalInfo | None) -> AdditionalInfo | None:
+    """Convert a dict into `AdditionalInfo` unless it is already converted or `None`.
+
+    Args:
+        value (dict | AdditionalInfo | None): Additional state information.
+
+    Returns:
+        Converted `AdditionalInfo`, or `None` if the input is `None`.
+    """
+    return AdditionalInfo(**value) if isinstance(value, dict) else value
+
+
 @SCHEMAS.register(SchemaName.VEHICLE_STATE)
+@define
 class VehicleState(SchemaBase):
     """A dataclass to represent schema table of `vehicle_state.json`.
 
@@ -84,10 +109,6 @@ class VehicleState(SchemaBase):
     steer_pedal: float | None = field(default=None)
     steering_tire_angle: float | None = field(default=None)
     steering_wheel_angle: float | None = field(default=None)
-    shift_state: ShiftState | None = field(default=None, converter=optional(ShiftState))
-    indicators: Indicators | None = field(
-        default=None, converter=lambda x: Indicators(**x) if isinstance(x, dict) else x
-    )
-    additional_info: AdditionalInfo | None = field(
-        default=None, converter=lambda x: AdditionalInfo(**x) if isinstance(x, dict) else x
-    )
+    shift_state: ShiftState | None = field(default=None, converter=to_optional_enum(ShiftState))
+    indicators: Indicators | None = field(default=None, converter=_to_indicators)
+    additional_info: AdditionalInfo | None = field(default=None, converter=_to_additional_info)
@@ -34,9 +34,8 @@ class VisibilityLevel(str, Enum):
     @classmethod
     def from_value(cls, level: str) -> Self:
         """Load member from its value."""
-        if level not in cls.__members__.values():
-            return cls._from_alias(level)
-        return cls(level)
+        member = cls._value2member_map_.get(level)
+        return cls._from_alias(level) if member is None else member
 
     @staticmethod
     def _from_alias(level: str) -> Self:
@@ -60,8 +59,20 @@ class VisibilityLevel(str, Enum):
             return VisibilityLevel.UNAVAILABLE
 
 
-@define(slots=False)
+def _to_visibility_level(value: str | VisibilityLevel) -> VisibilityLevel:
+    """Convert a value or its alias into `VisibilityLevel` unless it is already converted.
+
+    Args:
+        value (str | VisibilityLevel): Level of visibility.
+
+    Returns:
+        Corresponding member of `VisibilityLevel`.
+    """
+    return value if type(value) is VisibilityLevel else VisibilityLevel.from_value(value)
+
+
 @SCHEMAS.register(SchemaName.VISIBILITY)
+@define
 class Visibility(SchemaBase):
     """A dataclass to represent schema table of `visibility.json`.
 
@@ -71,9 +82,5 @@ class Visibility(SchemaBase):
         description (str): Description of visibility level.
     """
 
-    level: VisibilityLevel = field(
-        converter=lambda x: VisibilityLevel.from_value(x)
-        if not isinstance(x, VisibilityLevel)
-        else VisibilityLevel(x)
-    )
+    level: VisibilityLevel = field(converter=_to_visibility_level)
     description: str
@@ -0,0 +1,65 @@
+from enum import Enum
+
+import numpy as np
+import pytest
+
+from t4_devkit.common.converter import (
+    to_enum,
+    to_float64_array,
+    to_optional_enum,
+    to_optional_float64_array,
+)
+
+
+class _Color(str, Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+def test_to_float64_array() -> None:
+    """Test converting array like to float64 array."""
+    ret = to_float64_array([1, 2, 3])
+    assert ret.dtype == np.float64
+    assert np.allclose(ret, [1.0, 2.0, 3.0])
+
+    # float64 array is returned without copy
+    value = np.array([1.0, 2.0, 3.0])
+    assert to_float64_array(value) is value
+
+
+def test_to_optional_float64_array() -> None:
+    """Test converting optional array like to float64 array."""
+    assert to_optional_float64_array(None) is None
+
+    ret = to_optional_float64_array([1, 2, 3])
+    assert ret.dtype == np.float64
+    assert np.allclose(ret, [1.0, 2.0, 3.0])
+
+
+def test_to_enum() -> None:
+    """Test converting value into enum member."""
+    converter = to_enum(_Color)
+
+    # member is returned as it is
+    assert converter(_Color.RED) is _Color.RED
+
+    # value is converted into the corresponding member
+    assert converter("blue") is _Color.BLUE
+
+    # invalid value raises ValueError
+    with pytest.raises(ValueError):
+        converter("green")
+    with pytest.raises(ValueError):
+        converter(["red"])
+
+
+def test_to_optional_enum() -> None:
+    """Test converting optional value into enum member."""
+    converter = to_optional_enum(_Color)
+
+    assert converter(None) is None
+    assert converter(_Color.RED) is _Color.RED
+    assert converter("blue") is _Color.BLUE
+
+    with pytest.raises(ValueError):
+        converter("green")
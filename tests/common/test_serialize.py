@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from enum import Enum
+
+import numpy as np
+from attrs import define, field
+from pyquaternion import Quaternion
+
+from t4_devkit.common.serialize import serialize_dataclass
+
+
+class _Color(str, Enum):
+    RED = "red"
+
+
+@define
+class _Inner:
+    size: tuple[int, int] = field(converter=tuple)
+    color: _Color
+
+
+@define
+class _Outer:
+    translation: np.ndarray
+    rotation: Quaternion
+    inner: _Inner
+    items: list[_Inner]
+    shortcut: str = field(init=False, factory=str)
+
+
+def test_serialize_dataclass() -> None:
+    """Test serializing nested dataclasses into dict."""
+    data = _Outer(
+        translation=np.array([1.0, 2.0, 3.0]),
+        rotation=Quaternion([1.0, 0.0, 0.0, 0.0]),
+        inner=_Inner(size=[1, 2], color=_Color.RED),
+        items=[_Inner(size=[3, 4], color=_Color.RED)],
+    )
+
+    serialized = serialize_dataclass(data)
+
+    # fields specified with `init=False` are skipped
+    assert serialized == {
+        "translation": [1.0, 2.0, 3.0],
+        "rotation": [1.0, 0.0, 0.0, 0.0],
+        "inner": {"size": [1, 2], "color": "red"},
+        "items": [{"size": [3, 4], "color": "red"}],
+    }
@@ -21,3 +21,13 @@ def test_new_attribute(attribute_dict) -> None:
     ret = Attribute.new(without_token)
     # check the new token is not the same with the token in input data
     assert ret.token != attribute_dict["token"]
+
+
+def test_new_many_attributes(attribute_dict) -> None:
+    """Test generating attributes with new tokens at once."""
+    without_token = {k: v for k, v in attribute_dict.items() if k != "token"}
+    ret = Attribute.new_many([without_token, without_token])
+    assert len(ret) == 2
+    # check the new tokens are unique and not the same with the token in input data
+    assert len({r.token for r in ret} | {attribute_dict["token"]}) == 3
+    assert all(len(r.token) == 32 for r in ret)
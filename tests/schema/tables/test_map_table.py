@@ -21,3 +21,11 @@ def test_new_map(map_dict) -> None:
     ret = Map.new(without_token)
     # check the new token is not the same with the token in input data
     assert ret.token != map_dict["token"]
+
+
+def test_map_interned_log_tokens(map_dict) -> None:
+    """Test equal log tokens share the same object across maps."""
+    token = "".join(["d3262a477673e130", "6db1791203be81d4"])
+    first = Map.from_dict({**map_dict, "log_tokens": [token]})
+    second = Map.from_dict({**map_dict, "log_tokens": [token[:16] + token[16:]]})
+    assert first.log_tokens[0] is second.log_tokens[0]
@@ -21,3 +21,11 @@ def test_new_object_ann(object_ann_dict) -> None:
     ret = ObjectAnn.new(without_token)
     # check the new token is not the same with the token in input data
     assert ret.token != object_ann_dict["token"]
+
+
+def test_object_ann_interned_attribute_tokens(object_ann_dict) -> None:
+    """Test equal attribute tokens share the same object across object annotations."""
+    token = "".join(["d3262a477673e130", "6db1791203be81d4"])
+    first = ObjectAnn.from_dict({**object_ann_dict, "attribute_tokens": [token]})
+    second = ObjectAnn.from_dict({**object_ann_dict, "attribute_tokens": [token[:16] + token[16:]]})
+    assert first.attribute_tokens[0] is second.attribute_tokens[0]
@@ -21,3 +21,13 @@ def test_new_sample_annotation(sample_annotation_dict) -> None:
     ret = SampleAnnotation.new(without_token)
     # check the new token is not the same with the token in input data
     assert ret.token != sample_annotation_dict["token"]
+
+
+def test_sample_annotation_interned_attribute_tokens(sample_annotation_dict) -> None:
+    """Test equal attribute tokens share the same object across sample annotations."""
+    token = "".join(["d3262a477673e130", "6db1791203be81d4"])
+    first = SampleAnnotation.from_dict({**sample_annotation_dict, "attribute_tokens": [token]})
+    second = SampleAnnotation.from_dict(
+        {**sample_annotation_dict, "attribute_tokens": [token[:16] + token[16:]]}
+    )
+    assert first.attribute_tokens[0] is second.attribute_tokens[0]
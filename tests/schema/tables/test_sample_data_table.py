@@ -23,6 +23,10 @@ def test_fileformat() -> None:
         # check as_ext() returns .value
         assert member.as_ext() == f".{value}"
 
+    # check is_member() returns False for non-member items including unhashable ones
+    assert not FileFormat.is_member("txt")
+    assert not FileFormat.is_member(["jpg"])
+
 
 def test_sample_data_json(sample_data_json) -> None:
     """Test loading sample data from a json file."""
@@ -1,3 +1,9 @@
+import base64
+
+import numpy as np
+import pytest
+from pycocotools import mask as cocomask
+
 from t4_devkit.schema import SurfaceAnn, serialize_schema, serialize_schemas
 
 
@@ -21,3 +27,29 @@ def test_new_surface_ann(surface_ann_dict) -> None:
     ret = SurfaceAnn.new(without_token)
     # check the new token is not the same with the token in input data
     assert ret.token != surface_ann_dict["token"]
+
+
+def test_surface_ann_bbox(surface_ann_dict) -> None:
+    """Test calculating bounding box of surface ann from its mask."""
+    mask = np.zeros((40, 30), dtype=np.uint8, order="F")
+    mask[5:12, 8:20] = 1
+    mask[30, 2] = 1
+    rle = cocomask.encode(mask)
+
+    data = surface_ann_dict.copy()
+    data["mask"] = {"size": rle["size"], "counts": base64.b64encode(rle["counts"]).decode()}
+    schema = SurfaceAnn.from_dict(data)
+
+    assert tuple(int(v) for v in schema.bbox) == (5, 2, 30, 19)
+
+
+def test_surface_ann_bbox_empty_mask(surface_ann_dict) -> None:
+    """Test calculating bounding box of surface ann with an empty mask raises."""
+    rle = cocomask.encode(np.zeros((40, 30), dtype=np.uint8, order="F"))
+
+    data = surface_ann_dict.copy()
+    data["mask"] = {"size": rle["size"], "counts": base64.b64encode(rle["counts"]).decode()}
+    schema = SurfaceAnn.from_dict(data)
+
+    with pytest.raises(ValueError):
+        schema.bbox